@@ -2,16 +2,62 @@
 
 """Helper to deal with querystring parameters according to jsonapi specification"""
 
-import json
+import re
+from functools import lru_cache
+from json import loads as _stdlib_json_loads
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
 
 from flask import current_app
+from werkzeug.utils import cached_property
 
 from flask_rest_jsonapi.exceptions import BadRequest, InvalidFilters, InvalidSort, InvalidField, InvalidInclude
 from flask_rest_jsonapi.schema import get_model_field, get_relationships, get_schema_from_type
 
+# orjson silently parses integers too large for 64 bits as floats
+_LONG_NUMBER_RE = re.compile(r'\d{19}')
+
+# schema registry resolutions are stable for the life of the application
+_get_schema_from_type = lru_cache(maxsize=256)(get_schema_from_type)
+
+
+def json_loads(value):
+    """Parse a JSON document with orjson when it is installed, returning the same result as the json module
+
+    Documents orjson can't represent exactly (integers beyond 64 bits) or rejects (NaN, Infinity, out of range
+    floats) are parsed with the json module.
+
+    :param str value: the JSON document
+    :return: the parsed document
+    """
+    if _orjson_loads is not None and not _LONG_NUMBER_RE.search(value):
+        try:
+            return _orjson_loads(value)
+        except ValueError:
+            pass
+    return _stdlib_json_loads(value)
+
+
+@lru_cache(maxsize=256)
+def _get_relationships(schema):
+    """Return relationship fields of a schema, computed once per schema class
+
+    :param Schema schema: a marshmallow schema
+    :return frozenset: relationship fields of the schema
+    """
+    return frozenset(get_relationships(schema))
+
 
 class QueryStringManager(object):
-    """Querystring parser according to jsonapi reference"""
+    """Querystring parser according to jsonapi reference
+
+    Querystring parameters are parsed from qs on first access and cached, so qs must not be modified once a parsed
+    value has been read. filters, pagination, fields, sorting and include return the same object on each access:
+    changes made to it (e.g. in a before_get_collection hook) are seen by the rest of the request.
+    """
 
     MANAGED_KEYS = (
         'filter',
@@ -22,6 +68,13 @@ class QueryStringManager(object):
         'q'
     )
 
+    # parameter families given as name[key]=value, matched by prefix like page[size] or filter[name]
+    BRACKETED_KEYS = (
+        'filter[',
+        'page',
+        'fields'
+    )
+
     def __init__(self, querystring, schema):
         """Initialization instance
 
@@ -33,45 +86,50 @@ class QueryStringManager(object):
         self.qs = querystring
         self.schema = schema
 
-    def _get_key_values(self, name):
-        """Return a dict containing key / values items for a given key, used for items like filters, page, etc.
+    @cached_property
+    def _index(self):
+        """Scan the querystring once to collect managed parameters and index parameters of bracketed families
 
-        :param str name: name of the querystring parameter
-        :return dict: a dict of key / values items
+        :return tuple: managed parameters, bracketed parameters by family and malformed keys by family
         """
-        results = {}
-
+        managed = {}
+        bracketed = {}
+        malformed = {}
         for key, value in self.qs.items():
-            try:
-                if not key.startswith(name):
-                    continue
-
-                key_start = key.index('[') + 1
-                key_end = key.index(']')
-                item_key = key[key_start:key_end]
+            key_start = key.find('[')
+            if (key if key_start == -1 else key[:key_start]) in self.MANAGED_KEYS:
+                managed[key] = value
+            for name in self.BRACKETED_KEYS:
+                if key.startswith(name):
+                    break
+            else:
+                continue
+            key_end = key.find(']', key_start + 1)
+            if key_start == -1 or key_end == -1:
+                malformed.setdefault(name, key)
+                continue
+            if isinstance(value, str):
+                item_values = value.split(',')
+            elif isinstance(value, (list, tuple)):
+                item_values = list(value)
+            else:
+                malformed.setdefault(name, key)
+                continue
+            bracketed.setdefault(name, {})[key[key_start + 1:key_end]] = item_values
+
+        return managed, bracketed, malformed
 
-                if ',' in value:
-                    item_value = value.split(',')
-                else:
-                    item_value = value
-                results.update({item_key: item_value})
-            except Exception:
-                raise BadRequest("Parse error", source={'parameter': key})
-
-        return results
-
-    def _simple_filters(self, dict_):
-        """Return filter list
+    def _get_key_values(self, name):
+        """Return a dict containing key / values items for a given key, used for items like filters, page, etc.
 
-        :return list: list of dict for filter parameters. Includes support for 'in' for list values
+        :param str name: name of the querystring parameter
+        :return dict: a dict of key / list of comma separated values items
         """
-        filter_list = []
-        for (key, value) in dict_.items():
-            operator = 'eq'
-            if isinstance(value, list):
-                operator = 'in'
-            filter_list.append({"name": key, "op": operator, "val": value})
-        return filter_list
+        bracketed, malformed = self._index[1:]
+        if name in malformed:
+            raise BadRequest("Parse error", source={'parameter': malformed[name]})
+
+        return bracketed.get(name, {})
 
     @property
     def querystring(self):
@@ -79,27 +137,34 @@ class QueryStringManager(object):
 
         :return dict: dict of managed querystring parameter
         """
-        return {key: value for (key, value) in self.qs.items()
-                if key.startswith(self.MANAGED_KEYS) or self._get_key_values('filter[')}
+        return dict(self._index[0])
 
-    @property
+    @cached_property
     def filters(self):
         """Return filters from query string.
 
+        Simple filters like filter[name]=value are added as 'eq' filters, or as 'in' filters for comma separated values.
+
         :return list: filter information
         """
-        results = []
         filters = self.qs.get('filter')
+        bracket_filters = self._get_key_values('filter[')
+        if filters is None and not bracket_filters:
+            return []
+
+        results = []
         if filters is not None:
             try:
-                results.extend(json.loads(filters))
+                results.extend(json_loads(filters))
             except (ValueError, TypeError):
                 raise InvalidFilters("Parse error")
-        if self._get_key_values('filter['):
-            results.extend(self._simple_filters(self._get_key_values('filter[')))
+        if bracket_filters:
+            results.extend({"name": key, "op": 'eq', "val": values[0]} if len(values) == 1 else
+                           {"name": key, "op": 'in', "val": values}
+                           for (key, values) in bracket_filters.items())
         return results
 
-    @property
+    @cached_property
     def pagination(self):
         """Return all page parameters as a dict.
 
@@ -119,26 +184,30 @@ class QueryStringManager(object):
             {'number': '25', 'size': '10'}
         """
         # check values type
-        result = self._get_key_values('page')
-        for key, value in result.items():
+        result = {}
+        int_values = {}
+        for key, values in self._get_key_values('page').items():
             if key not in ('number', 'size'):
                 raise BadRequest("{} is not a valid parameter of pagination".format(key), source={'parameter': 'page'})
             try:
-                int(value)
-            except ValueError:
+                value, = values
+                int_values[key] = int(value)
+            except (ValueError, TypeError):
                 raise BadRequest("Parse error", source={'parameter': 'page[{}]'.format(key)})
+            result[key] = value
 
-        if current_app.config.get('ALLOW_DISABLE_PAGINATION', True) is False and int(result.get('size', 1)) == 0:
+        config = current_app.config
+        if config.get('ALLOW_DISABLE_PAGINATION', True) is False and int_values.get('size', 1) == 0:
             raise BadRequest("You are not allowed to disable pagination", source={'parameter': 'page[size]'})
 
-        if current_app.config.get('MAX_PAGE_SIZE') is not None and 'size' in result:
-            if int(result['size']) > current_app.config['MAX_PAGE_SIZE']:
-                raise BadRequest("Maximum page size is {}".format(current_app.config['MAX_PAGE_SIZE']),
-                                 source={'parameter': 'page[size]'})
+        max_page_size = config.get('MAX_PAGE_SIZE')
+        if max_page_size is not None and 'size' in int_values:
+            if int_values['size'] > max_page_size:
+                raise BadRequest("Maximum page size is {}".format(max_page_size), source={'parameter': 'page[size]'})
 
         return result
 
-    @property
+    @cached_property
     def fields(self):
         """Return fields wanted by client.
 
@@ -151,20 +220,18 @@ class QueryStringManager(object):
             }
 
         """
-        result = self._get_key_values('fields')
-        for key, value in result.items():
-            if not isinstance(value, list):
-                result[key] = [value]
-
-        for key, value in result.items():
-            schema = get_schema_from_type(key)
-            for obj in value:
-                if obj not in schema._declared_fields:
+        result = {}
+        for key, values in self._get_key_values('fields').items():
+            schema = _get_schema_from_type(key)
+            declared_fields = schema._declared_fields
+            for obj in values:
+                if obj not in declared_fields:
                     raise InvalidField("{} has no attribute {}".format(schema.__name__, obj))
+            result[key] = list(values)
 
         return result
 
-    @property
+    @cached_property
     def sorting(self):
         """Return fields to sort by including sort name for SQLAlchemy and row
         sort parameter for other ORMs
@@ -178,33 +245,40 @@ class QueryStringManager(object):
             ]
 
         """
-        if self.qs.get('sort'):
-            sorting_results = []
-            for sort_field in self.qs['sort'].split(','):
-                field = sort_field.replace('-', '')
-                if field not in self.schema._declared_fields:
-                    raise InvalidSort("{} has no attribute {}".format(self.schema.__name__, field))
-                if field in get_relationships(self.schema):
-                    raise InvalidSort("You can't sort on {} because it is a relationship field".format(field))
-                field = get_model_field(self.schema, field)
-                order = 'desc' if sort_field.startswith('-') else 'asc'
-                sorting_results.append({'field': field, 'order': order})
-            return sorting_results
-
-        return []
-
-    @property
+        sort_param = self.qs.get('sort')
+        if not sort_param:
+            return []
+
+        sorting_results = []
+        declared_fields = self.schema._declared_fields
+        relationships = _get_relationships(self.schema)
+        for sort_field in sort_param.split(','):
+            minus = sort_field.startswith('-')
+            field = sort_field[1:] if minus else sort_field
+            if field not in declared_fields:
+                raise InvalidSort("{} has no attribute {}".format(self.schema.__name__, field))
+            if field in relationships:
+                raise InvalidSort("You can't sort on {} because it is a relationship field".format(field))
+            sorting_results.append({'field': get_model_field(self.schema, field), 'order': 'desc' if minus else 'asc'})
+
+        return sorting_results
+
+    @cached_property
     def include(self):
         """Return fields to include
 
         :return list: a list of include information
         """
-        include_param = self.qs.get('include', [])
-
-        if current_app.config.get('MAX_INCLUDE_DEPTH') is not None:
-            for include_path in include_param:
-                if len(include_path.split('.')) > current_app.config['MAX_INCLUDE_DEPTH']:
+        include_param = self.qs.get('include')
+        if not include_param:
+            return []
+
+        include_paths = include_param.split(',')
+        max_include_depth = current_app.config.get('MAX_INCLUDE_DEPTH')
+        if max_include_depth is not None:
+            for include_path in include_paths:
+                if include_path.count('.') + 1 > max_include_depth:
                     raise InvalidInclude("You can't use include through more than {} relationships"
-                                         .format(current_app.config['MAX_INCLUDE_DEPTH']))
+                                         .format(max_include_depth))
 
-        return include_param.split(',') if include_param else []
+        return include_paths
@@ -38,6 +38,7 @@ setup(
             'coveralls',
             'coverage'
         ],
-        'docs': 'sphinx'
+        'docs': 'sphinx',
+        'orjson': 'orjson'
     }
 )
@@ -21,6 +21,7 @@ from flask_rest_jsonapi.data_layers.base import BaseDataLayer
 from flask_rest_jsonapi.data_layers.filtering.alchemy import Node
 from flask_rest_jsonapi.decorators import check_headers, check_method_requirements, jsonapi_exception_formatter
 import flask_rest_jsonapi.decorators
+import flask_rest_jsonapi.querystring
 import flask_rest_jsonapi.resource
 import flask_rest_jsonapi.schema
 
@@ -574,6 +575,88 @@ def test_query_string_manager(person_schema):
     qsm.qs['sort'] = 'computers'
     with pytest.raises(InvalidSort):
         qsm.sorting
+    qsm.qs['sort'] = '-na-me'
+    with pytest.raises(InvalidSort):
+        qsm.sorting
+    qsm = QSManager({'sort': '-name,id'}, person_schema)
+    assert qsm.sorting == [{'field': 'name', 'order': 'desc'}, {'field': 'person_id', 'order': 'asc'}]
+    qsm = QSManager({'filter[name]': 'test', 'foo': 'bar', 'query': 'test', 'q': 'test'}, person_schema)
+    assert qsm.querystring == {'filter[name]': 'test', 'q': 'test'}
+    qsm.querystring['foo'] = 'bar'
+    assert 'foo' not in qsm.querystring
+
+
+def test_query_string_manager_parse_error(app, person_schema):
+    with app.app_context():
+        for query_string in ({'page': '2'}, {'pagesize': '3'}, {'pagesize[x]': '3'}, {'page_x[foo]': '1'},
+                             {'page]x[': '1'}, {'page[number': '1'}, {'page[size]': '1,2'},
+                             {'page[size]': 10}):
+            with pytest.raises(BadRequest):
+                QSManager(query_string, person_schema).pagination
+        with pytest.raises(BadRequest):
+            QSManager({'fields': 'name'}, person_schema).fields
+        with pytest.raises(BadRequest):
+            QSManager({'filter[name': 'x'}, person_schema).filters
+        assert QSManager({'fieldsx[person]': 'name'}, person_schema).fields == {'person': ['name']}
+
+
+def test_query_string_manager_simple_filters(person_schema):
+    qsm = QSManager({'filter[name]': 'a,b', 'filter[birth_date]': 'c'}, person_schema)
+    assert sorted(qsm.filters, key=lambda f: f['name']) == [{'name': 'birth_date', 'op': 'eq', 'val': 'c'},
+                                                            {'name': 'name', 'op': 'in', 'val': ['a', 'b']}]
+
+
+def test_query_string_manager_json_filters(person_schema):
+    filters = '[{"name": "id", "op": "in", "val": [123456789012345678901234, 1.5, NaN, 1e400]}]'
+    val = QSManager({'filter': filters}, person_schema).filters[0]['val']
+    assert val[:2] == [123456789012345678901234, 1.5] and val[2] != val[2] and val[3] == float('inf')
+    with pytest.raises(InvalidFilters):
+        QSManager({'filter': 'error'}, person_schema).filters
+
+
+def test_query_string_manager_json_filters_without_orjson(person_schema, monkeypatch):
+    monkeypatch.setattr(flask_rest_jsonapi.querystring, '_orjson_loads', None)
+    test_query_string_manager_json_filters(person_schema)
+
+
+def test_query_string_manager_cached_properties(person_schema):
+    qsm = QSManager({'filter[name]': 'test', 'sort': 'name'}, person_schema)
+    assert qsm.filters is qsm.filters
+    qsm.filters.append({'name': 'birth_date', 'op': 'eq', 'val': None})
+    assert len(qsm.filters) == 2
+    assert qsm.sorting is qsm.sorting
+    qsm = QSManager({'sort': 'computers'}, person_schema)
+    with pytest.raises(InvalidSort):
+        qsm.sorting
+    with pytest.raises(InvalidSort):
+        qsm.sorting
+
+
+def test_query_string_manager_fields(person_schema):
+    qsm = QSManager({'fields[person]': 'name'}, person_schema)
+    assert qsm.fields == {'person': ['name']}
+    qsm.fields['person'].append('birth_date')
+    assert qsm._get_key_values('fields') == {'person': ['name']}
+
+
+def test_query_string_manager_lazy_parsing(app, person_schema):
+    qsm = QSManager({}, person_schema)
+    qsm.qs['page[size]'] = '5'
+    qsm.qs['sort'] = 'name'
+    with app.app_context():
+        assert qsm.pagination == {'size': '5'}
+    assert qsm.querystring == {'page[size]': '5', 'sort': 'name'}
+    assert qsm.sorting == [{'field': 'name', 'order': 'asc'}]
+
+
+def test_query_string_manager_include_depth(app, person_schema, monkeypatch):
+    monkeypatch.setitem(app.config, 'MAX_INCLUDE_DEPTH', 2)
+    with app.app_context():
+        qsm = QSManager({'include': 'computers.owner,computers'}, person_schema)
+        assert qsm.include == ['computers.owner', 'computers']
+        qsm = QSManager({'include': 'computers.owner.computers'}, person_schema)
+        with pytest.raises(InvalidInclude):
+            qsm.include
 
 
 def test_resource(app, person_model, person_schema, session, monkeypatch):